@@ -1,16 +1,48 @@
 """Main runner for QAEvolver multi-hop QA evaluation on HotpotQA."""
 
-import json
+import asyncio
 import os
 from pathlib import Path
+from typing import Callable
 
 import dspy
+import orjson
 
 from src.context_.context import openai_key
 from src.data_loader import load_hotpotqa_splits
 from src.qaevolver.modules.multihop_qa_pipeline import MultiHopQAPipeline
+from src.qaevolver.modules.retriever import aclose as aclose_retriever
+from src.evaluation.async_evaluate import aevaluate
 from src.evaluation.hotpotqa_metrics import answer_em, answer_f1, print_hotpotqa_results
 
+# Maximum number of examples evaluated concurrently on the event loop
+ASYNC_MAX_WORKERS = 200
+# Questions per batched LLM call for the initial query and answer steps. Keep at 1
+# to score `forward` itself; larger batches use separate batched predictors, so
+# the reported F1 is then for a different program than the one optimizers tune.
+BATCH_SIZE = 1
+
+
+async def evaluate_validation(
+    pipeline: MultiHopQAPipeline,
+    val: list[dspy.Example],
+    on_result: Callable[[dspy.Example, dspy.Prediction, float], None],
+):
+    """Evaluate the pipeline on the validation set, closing pooled HTTP clients afterwards."""
+    try:
+        return await aevaluate(
+            pipeline,
+            devset=val,
+            metric=answer_f1,
+            max_concurrency=ASYNC_MAX_WORKERS,
+            batch_size=BATCH_SIZE,
+            display_progress=True,
+            on_result=on_result,
+            return_outputs=False,
+        )
+    finally:
+        await aclose_retriever()
+
 
 def main():
     # Configure DSPy with GPT-4.1
@@ -23,69 +55,60 @@ def main():
     print(f"  Train: {len(train)}, Val: {len(val)}, Test: {len(test)}")
 
     # Initialize pipeline
-    pipeline = MultiHopQAPipeline()
-
-    # Run evaluation on validation set with F1 as primary metric
-    print(f"\nEvaluating on {len(val)} validation examples...")
-    evaluator = dspy.Evaluate(
-        devset=val,
-        metric=answer_f1,
-        num_threads=4,
-        display_progress=True,
-        return_all_scores=True,
-        return_outputs=True,
-    )
-
-    f1_score, outputs = evaluator(pipeline)
-
-    # Compute EM as secondary metric from the same outputs
+    pipeline = MultiHopQAPipeline(batch_steps=BATCH_SIZE > 1)
+
+    # Stream per-example results to JSONL as each example completes
+    results_dir = Path("results")
+    results_dir.mkdir(exist_ok=True)
+    results_path = results_dir / "validation_results.jsonl"
+    metrics_path = results_dir / "metrics.json"
+
     em_scores = []
-    detailed_results = []
-
-    for example, prediction, score in outputs:
-        em = answer_em(example, prediction)
-        em_scores.append(em)
-
-        detailed_results.append({
-            "id": example.id,
-            "question": example.question,
-            "gold_answer": example.answer,
-            "predicted_answer": prediction.answer,
-            "query_1": prediction.query_1,
-            "evidence_summary_1": prediction.evidence_summary_1,
-            "query_2": prediction.query_2,
-            "evidence_summary_2": prediction.evidence_summary_2,
-            "f1": score,
-            "em": em,
-            "type": example.type,
-            "level": example.level,
-        })
+
+    with open(results_path, "wb") as results_file:
+
+        def write_result(example: dspy.Example, prediction: dspy.Prediction, score: float) -> None:
+            # Compute EM as secondary metric from the same outputs
+            em = answer_em(example, prediction) if "answer" in prediction else 0.0
+            em_scores.append(em)
+
+            results_file.write(orjson.dumps({
+                "id": example.id,
+                "question": example.question,
+                "gold_answer": example.answer,
+                "predicted_answer": prediction.get("answer"),
+                "query_1": prediction.get("query_1"),
+                "evidence_summary_1": prediction.get("evidence_summary_1"),
+                "query_2": prediction.get("query_2"),
+                "evidence_summary_2": prediction.get("evidence_summary_2"),
+                "f1": score,
+                "em": em,
+                "type": example.type,
+                "level": example.level,
+            }) + b"\n")
+            results_file.flush()
+
+        # Run evaluation on validation set with F1 as primary metric
+        print(f"\nEvaluating on {len(val)} validation examples...")
+        f1_score, _ = asyncio.run(evaluate_validation(pipeline, val, on_result=write_result))
 
     em_score = sum(em_scores) / len(em_scores) * 100 if em_scores else 0.0
 
     # Print results
     print_hotpotqa_results(em_score, f1_score, len(val), "Validation")
 
-    # Save detailed results
-    results_dir = Path("results")
-    results_dir.mkdir(exist_ok=True)
-    results_path = results_dir / "validation_results.json"
-
-    with open(results_path, "w") as f:
-        json.dump(
+    # Save aggregate metrics
+    with open(metrics_path, "wb") as f:
+        f.write(orjson.dumps(
             {
-                "metrics": {
-                    "em": em_score,
-                    "f1": f1_score,
-                    "num_examples": len(val),
-                },
-                "results": detailed_results,
+                "em": em_score,
+                "f1": f1_score,
+                "num_examples": len(val),
             },
-            f,
-            indent=2,
-        )
+            option=orjson.OPT_INDENT_2,
+        ))
 
-    print(f"Detailed results saved to {results_path}")
+    print(f"Detailed results saved to {results_path}, metrics to {metrics_path}")
 
 
 if __name__ == "__main__":
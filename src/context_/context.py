@@ -2,4 +2,14 @@ import os
 openai_key = os.getenv("OPENAI_AGENTJUDGEJG_KEY")
 serper_key = os.getenv("SERPER_KEY")
 firecrawl_key = os.getenv("FIRECRAWL_KEY")
-newsapi_key = os.getenv("NEWSAPI_KEY")
\ No newline at end of file
+newsapi_key = os.getenv("NEWSAPI_KEY")
+
+# Maximum in-flight requests per provider for the async pipeline
+llm_concurrency = int(os.getenv("LLM_CONCURRENCY", "32"))
+serper_concurrency = int(os.getenv("SERPER_CONCURRENCY", "32"))
+firecrawl_concurrency = int(os.getenv("FIRECRAWL_CONCURRENCY", "16"))
+
+# On-disk cache for LLM stage outputs (see src/qaevolver/modules/llm_cache.py)
+llm_cache_dir = os.getenv("LLM_CACHE_DIR", "./cache/llm")
+# On-disk cache of scraped pages keyed by URL (see src/qaevolver/modules/retriever.py)
+scrape_cache_dir = os.getenv("SCRAPE_CACHE_DIR", "./cache/scrape")
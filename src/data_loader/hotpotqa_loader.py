@@ -1,10 +1,45 @@
 """HotpotQA dataset loader using HuggingFace datasets."""
 
+import importlib.util
+import os
 import random
+from pathlib import Path
+
+# Rust-based parallel downloads for the first fetch; must be set before huggingface_hub is imported
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
 
 import dspy
+import pyarrow as pa
+import pyarrow.parquet as pq
 from datasets import load_dataset
 
+COLUMNS = ["id", "question", "answer", "type", "level"]
+CACHE_DIR = Path("data")
+
+
+def _load_split_batches() -> tuple[pa.RecordBatch, pa.RecordBatch]:
+    """Load the train and validation splits, restricted to COLUMNS.
+
+    The first call downloads the fullwiki config and writes the pruned
+    columns to ./data/hotpot_{split}.parquet; later calls read the parquet
+    files directly without touching HuggingFace. Each split is returned as
+    a single contiguous RecordBatch.
+    """
+    paths = {split: CACHE_DIR / f"hotpot_{split}.parquet" for split in ("train", "validation")}
+
+    if not all(path.exists() for path in paths.values()):
+        dataset = load_dataset("hotpotqa/hotpot_qa", "fullwiki", trust_remote_code=True)
+        CACHE_DIR.mkdir(exist_ok=True)
+        for split, path in paths.items():
+            # Write to a temp file first so an interrupted run never leaves a truncated split behind
+            tmp_path = path.with_name(path.name + ".tmp")
+            dataset[split].select_columns(COLUMNS).to_parquet(tmp_path)
+            os.replace(tmp_path, path)
+
+    train, validation = (pq.read_table(paths[split]).combine_chunks() for split in ("train", "validation"))
+    return train.to_batches()[0], validation.to_batches()[0]
+
 
 def load_hotpotqa_splits(
     train_size: int = 800,
@@ -14,8 +49,10 @@ def load_hotpotqa_splits(
 ) -> tuple[list[dspy.Example], list[dspy.Example], list[dspy.Example]]:
     """Load HotpotQA splits as DSPy Examples.
 
-    Loads the fullwiki config from HuggingFace and creates random samples
-    for train, validation, and test splits.
+    Loads the fullwiki config from HuggingFace (cached locally as parquet)
+    and creates random samples for train, validation, and test splits.
+    The test sample is drawn from the official train split and is disjoint
+    from the train sample.
 
     Args:
         train_size: Number of training examples to sample.
@@ -27,28 +64,28 @@ def load_hotpotqa_splits(
         Tuple of (train, val, test) as lists of dspy.Example.
         Each Example has: id, question (input), answer, type, level (labels).
     """
-    dataset = load_dataset("hotpotqa/hotpot_qa", "fullwiki", trust_remote_code=True)
-
-    train_data = list(dataset["train"])
-    validation_data = list(dataset["validation"])
+    train_data, validation_data = _load_split_batches()
+    n_train, n_val = train_data.num_rows, validation_data.num_rows
 
     rng = random.Random(seed)
 
-    train_sample = rng.sample(train_data, min(train_size, len(train_data)))
-    val_sample = rng.sample(validation_data, min(val_size, len(validation_data)))
-    test_sample = rng.sample(train_data, min(test_size, len(train_data)))
-
-    def to_examples(samples: list[dict]) -> list[dspy.Example]:
-        examples = []
-        for item in samples:
-            example = dspy.Example(
-                id=item["id"],
-                question=item["question"],
-                answer=item["answer"],
-                type=item["type"],
-                level=item["level"],
-            ).with_inputs("question")
-            examples.append(example)
-        return examples
-
-    return to_examples(train_sample), to_examples(val_sample), to_examples(test_sample)
+    train_idx = rng.sample(range(n_train), min(train_size, n_train))
+    val_idx = rng.sample(range(n_val), min(val_size, n_val))
+    # Test is also drawn from the official train split, so exclude the train sample
+    test_pool = sorted(set(range(n_train)) - set(train_idx))
+    test_idx = rng.sample(test_pool, min(test_size, len(test_pool)))
+
+    def to_examples(batch: pa.RecordBatch, indices: list[int]) -> list[dspy.Example]:
+        # Convert only the sampled rows, one column at a time, rather than row by row
+        rows = batch.take(pa.array(indices, type=pa.int64()))
+        columns = [rows.column(name).to_pylist() for name in COLUMNS]
+        return [
+            dspy.Example(**dict(zip(COLUMNS, values))).with_inputs("question")
+            for values in zip(*columns)
+        ]
+
+    return (
+        to_examples(train_data, train_idx),
+        to_examples(validation_data, val_idx),
+        to_examples(train_data, test_idx),
+    )
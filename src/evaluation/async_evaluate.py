@@ -0,0 +1,109 @@
+"""Async evaluation of DSPy programs on a single event loop."""
+
+import asyncio
+from typing import Callable, Optional
+
+import dspy
+from tqdm import tqdm
+
+
+async def aevaluate(
+    program: dspy.Module,
+    devset: list[dspy.Example],
+    metric: Callable,
+    max_concurrency: int = 200,
+    batch_size: int = 1,
+    display_progress: bool = True,
+    failure_score: float = 0.0,
+    on_result: Optional[Callable[[dspy.Example, dspy.Prediction, float], None]] = None,
+    return_outputs: bool = True,
+) -> tuple[float, list[tuple[dspy.Example, dspy.Prediction, float]]]:
+    """Evaluate a program concurrently through its `acall`/`aforward`.
+
+    Async counterpart of `dspy.Evaluate(..., return_all_scores=True, return_outputs=True)`:
+    all examples share one event loop instead of a thread pool, with at most
+    `max_concurrency` examples in flight.
+
+    Args:
+        program: DSPy module implementing `aforward` (and, when `batch_size > 1`,
+            `abatch_forward(questions, return_exceptions=True)` returning one
+            prediction or exception per question).
+        devset: Examples to evaluate.
+        metric: Metric function called as `metric(example, prediction)`.
+        max_concurrency: Maximum number of examples evaluated concurrently.
+        batch_size: Number of examples passed to each `abatch_forward` call.
+        display_progress: Whether to show a progress bar.
+        failure_score: Score assigned to examples that raise an exception.
+        on_result: Called with (example, prediction, score) as soon as each
+            example finishes, e.g. to stream results to disk.
+        return_outputs: Whether to keep and return every (example, prediction,
+            score). With False only a running score total is kept, so memory
+            stays flat when results are streamed through `on_result`.
+
+    Returns:
+        Tuple of (score on a 0-100 scale, list of (example, prediction, score)),
+        the list being empty when `return_outputs` is False.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency // batch_size))
+    progress = tqdm(total=len(devset), disable=not display_progress)
+    total_score = 0.0
+
+    def record(examples, predictions, scores) -> list[tuple[dspy.Example, dspy.Prediction, float]]:
+        nonlocal total_score
+        for example, prediction, score in zip(examples, predictions, scores):
+            total_score += score
+            if on_result is not None:
+                on_result(example, prediction, score)
+        progress.update(len(examples))
+        return list(zip(examples, predictions, scores)) if return_outputs else []
+
+    def score_prediction(example: dspy.Example, prediction: dspy.Prediction) -> float:
+        # Scored separately from the program call, so a metric error keeps the prediction
+        try:
+            return metric(example, prediction)
+        except Exception as e:
+            print(f"Error scoring example {example.get('id')}: {e}")
+            return failure_score
+
+    async def process_item(example: dspy.Example):
+        async with semaphore:
+            try:
+                prediction = await program.acall(**example.inputs())
+            except Exception as e:
+                print(f"Error evaluating example {example.get('id')}: {e}")
+                prediction, score = dspy.Prediction(), failure_score
+            else:
+                score = score_prediction(example, prediction)
+        return record([example], [prediction], [score])
+
+    async def process_batch(batch: list[dspy.Example]):
+        async with semaphore:
+            try:
+                results = await program.abatch_forward(
+                    [example.question for example in batch],
+                    return_exceptions=True,
+                )
+            except Exception as e:
+                results = [e] * len(batch)
+        # Failures are isolated per question, so one error does not zero the whole batch
+        predictions, scores = [], []
+        for example, result in zip(batch, results):
+            if isinstance(result, BaseException):
+                print(f"Error evaluating example {example.get('id')}: {result}")
+                predictions.append(dspy.Prediction())
+                scores.append(failure_score)
+            else:
+                predictions.append(result)
+                scores.append(score_prediction(example, result))
+        return record(batch, predictions, scores)
+
+    if batch_size > 1:
+        batches = [devset[i:i + batch_size] for i in range(0, len(devset), batch_size)]
+        chunks = await asyncio.gather(*(process_batch(batch) for batch in batches))
+    else:
+        chunks = await asyncio.gather(*(process_item(example) for example in devset))
+    progress.close()
+
+    outputs = [output for chunk in chunks for output in chunk]
+    score = total_score / len(devset) * 100 if devset else 0.0
+    return score, outputs
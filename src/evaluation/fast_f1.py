@@ -0,0 +1,136 @@
+"""SQuAD token-level F1 for HotpotQA answer scoring, with a Numba-compiled batch kernel."""
+
+import re
+import string
+from collections import Counter
+
+import numba
+import numpy as np
+
+_ARTICLES = re.compile(r"\b(a|an|the)\b")
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+
+
+def normalize_tokens(s: str) -> list[str]:
+    """Normalize and tokenize an answer as in the official SQuAD/HotpotQA evaluation scripts.
+
+    Lowercases, removes punctuation and articles, and splits on whitespace,
+    in a single translate + regex pass using the precompiled module tables.
+    """
+    return _ARTICLES.sub(" ", s.lower().translate(_PUNCT_TABLE)).split()
+
+
+def _token_ids(tokens: list[str], vocab: dict[str, int]) -> np.ndarray:
+    """Map tokens to integer ids for the compiled kernel.
+
+    Ids come from a vocabulary shared by the gold and predicted side of a
+    call, so distinct tokens never share an id (unlike truncated hashes).
+    """
+    return np.fromiter(
+        (vocab.setdefault(t, len(vocab)) for t in tokens),
+        dtype=np.int64,
+        count=len(tokens),
+    )
+
+
+@numba.njit
+def _token_f1(gold: np.ndarray, pred: np.ndarray) -> float:
+    """Token F1 over multiset intersection of two token-id arrays."""
+    if gold.size == 0 or pred.size == 0:
+        return 1.0 if gold.size == pred.size else 0.0
+
+    g = np.sort(gold)
+    p = np.sort(pred)
+    i = 0
+    j = 0
+    common = 0
+    while i < g.size and j < p.size:
+        if g[i] == p[j]:
+            common += 1
+            i += 1
+            j += 1
+        elif g[i] < p[j]:
+            i += 1
+        else:
+            j += 1
+
+    if common == 0:
+        return 0.0
+    precision = common / p.size
+    recall = common / g.size
+    return 2 * precision * recall / (precision + recall)
+
+
+@numba.njit
+def _batch_token_f1(
+    gold_ids: np.ndarray,
+    gold_offsets: np.ndarray,
+    pred_ids: np.ndarray,
+    pred_offsets: np.ndarray,
+) -> np.ndarray:
+    """Token F1 for each (gold, pred) pair packed as flat id arrays with offsets."""
+    n = gold_offsets.size - 1
+    scores = np.empty(n, dtype=np.float64)
+    for k in range(n):
+        scores[k] = _token_f1(
+            gold_ids[gold_offsets[k]:gold_offsets[k + 1]],
+            pred_ids[pred_offsets[k]:pred_offsets[k + 1]],
+        )
+    return scores
+
+
+def _pack(token_lists: list[list[str]], vocab: dict[str, int]) -> tuple[np.ndarray, np.ndarray]:
+    """Flatten token lists into one id array plus start offsets."""
+    offsets = np.zeros(len(token_lists) + 1, dtype=np.int64)
+    np.cumsum([len(tokens) for tokens in token_lists], out=offsets[1:])
+    ids = _token_ids([t for tokens in token_lists for t in tokens], vocab)
+    return ids, offsets
+
+
+def token_f1(gold_tokens: list[str], pred_tokens: list[str]) -> float:
+    """Compute SQuAD token F1 between two normalized token lists.
+
+    Plain Counter overlap: for a single pair this is as fast as the compiled
+    kernel, without the array conversion and dispatch overhead.
+
+    Args:
+        gold_tokens: Normalized gold answer tokens (see `normalize_tokens`).
+        pred_tokens: Normalized predicted answer tokens.
+
+    Returns:
+        Token-level F1 score between 0.0 and 1.0.
+    """
+    if not gold_tokens or not pred_tokens:
+        return 1.0 if len(gold_tokens) == len(pred_tokens) else 0.0
+    common = sum((Counter(gold_tokens) & Counter(pred_tokens)).values())
+    if common == 0:
+        return 0.0
+    precision = common / len(pred_tokens)
+    recall = common / len(gold_tokens)
+    return 2 * precision * recall / (precision + recall)
+
+
+def batch_token_f1(
+    gold_token_lists: list[list[str]],
+    pred_token_lists: list[list[str]],
+) -> np.ndarray:
+    """Compute SQuAD token F1 for many (gold, pred) pairs in one compiled call.
+
+    Args:
+        gold_token_lists: Normalized gold answer tokens, one list per example.
+        pred_token_lists: Normalized predicted answer tokens, one list per example.
+
+    Returns:
+        Array of token-level F1 scores, one per example.
+
+    Raises:
+        ValueError: If the two lists differ in length.
+    """
+    if len(gold_token_lists) != len(pred_token_lists):
+        raise ValueError(
+            f"Got {len(gold_token_lists)} gold answers but {len(pred_token_lists)} predictions"
+        )
+    vocab: dict[str, int] = {}
+    gold_ids, gold_offsets = _pack(gold_token_lists, vocab)
+    pred_ids, pred_offsets = _pack(pred_token_lists, vocab)
+    return _batch_token_f1(gold_ids, gold_offsets, pred_ids, pred_offsets)
@@ -1,12 +1,12 @@
-"""HotpotQA evaluation metrics wrapping DSPy's built-in scoring functions."""
+"""HotpotQA evaluation metrics using SQuAD-style answer normalization."""
 
-from dspy.evaluate.metrics import answer_exact_match, answer_passage_match
+from src.evaluation.fast_f1 import batch_token_f1, normalize_tokens, token_f1
 
 
 def answer_em(example, pred, trace=None) -> float:
     """Compute exact match score between predicted and gold answer.
 
-    Wraps DSPy's built-in answer_exact_match.
+    Answers are compared after the same SQuAD normalization used by answer_f1.
 
     Args:
         example: dspy.Example with 'answer' field.
@@ -16,13 +16,13 @@ def answer_em(example, pred, trace=None) -> float:
     Returns:
         1.0 if exact match, 0.0 otherwise.
     """
-    return float(answer_exact_match(example, pred, trace))
+    return float(normalize_tokens(example.answer) == normalize_tokens(pred.answer))
 
 
 def answer_f1(example, pred, trace=None) -> float:
     """Compute token-level F1 score between predicted and gold answer.
 
-    Uses DSPy's answer_passage_match which computes token-level F1.
+    Uses SQuAD answer normalization and multiset token overlap.
 
     Args:
         example: dspy.Example with 'answer' field.
@@ -32,20 +32,27 @@ def answer_f1(example, pred, trace=None) -> float:
     Returns:
         Token-level F1 score between 0.0 and 1.0.
     """
-    gold = example.answer.lower().split()
-    pred_tokens = pred.answer.lower().split()
+    return token_f1(normalize_tokens(example.answer), normalize_tokens(pred.answer))
 
-    if not gold or not pred_tokens:
-        return float(gold == pred_tokens)
 
-    common = set(gold) & set(pred_tokens)
-    if not common:
-        return 0.0
+def batch_f1(golds: list[str], preds: list[str]) -> list[float]:
+    """Compute token-level F1 for many gold/predicted answer pairs at once.
 
-    precision = len(common) / len(pred_tokens)
-    recall = len(common) / len(gold)
-    f1 = 2 * precision * recall / (precision + recall)
-    return f1
+    Normalizes every answer once and scores all pairs in a single
+    compiled call; equivalent to calling answer_f1 per pair.
+
+    Args:
+        golds: Gold answer strings.
+        preds: Predicted answer strings, aligned with `golds`.
+
+    Returns:
+        Token-level F1 scores between 0.0 and 1.0, one per pair.
+    """
+    scores = batch_token_f1(
+        [normalize_tokens(g) for g in golds],
+        [normalize_tokens(p) for p in preds],
+    )
+    return scores.tolist()
 
 
 def print_hotpotqa_results(em: float, f1: float, num_examples: int, split_name: str) -> None:
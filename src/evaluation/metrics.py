@@ -3,6 +3,8 @@
 from dataclasses import dataclass
 from typing import Optional, TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from src.data_loader.data_loader import LabelSchema
 
@@ -83,28 +85,33 @@ def calculate_metrics(
     else:
         accuracy_on_predictions = 0.0
 
-    # Build confusion matrix
-    confusion = {true_label: {pred_label: 0 for pred_label in labels} for true_label in labels}
-    for pred, true in zip(valid_preds, valid_truth):
-        if true in confusion and pred in labels:
-            confusion[true][pred] += 1
-
-    # Calculate per-class precision and recall
-    precisions = {}
-    recalls = {}
-
-    for label in labels:
-        # True positives: predicted label correctly
-        tp = confusion[label][label]
-
-        # False positives: predicted label but wrong
-        fp = sum(confusion[other][label] for other in labels if other != label)
-
-        # False negatives: was label but predicted something else
-        fn = sum(confusion[label][other] for other in labels if other != label)
-
-        precisions[label] = tp / (tp + fp) if (tp + fp) > 0 else 0.0
-        recalls[label] = tp / (tp + fn) if (tp + fn) > 0 else 0.0
+    # Build confusion matrix (rows=truth, cols=pred); pairs outside labels are dropped
+    n_labels = len(labels)
+    label_idx = {label: i for i, label in enumerate(labels)}
+    y_pred = np.fromiter((label_idx.get(p, -1) for p in valid_preds), dtype=np.int64, count=len(valid_preds))
+    y_true = np.fromiter((label_idx.get(g, -1) for g in valid_truth), dtype=np.int64, count=len(valid_truth))
+    mask = (y_pred >= 0) & (y_true >= 0)
+    cm = np.bincount(
+        y_true[mask] * n_labels + y_pred[mask],
+        minlength=n_labels * n_labels,
+    ).reshape(n_labels, n_labels)
+
+    confusion = {
+        true_label: {pred_label: int(cm[i, j]) for j, pred_label in enumerate(labels)}
+        for i, true_label in enumerate(labels)
+    }
+
+    # Calculate per-class precision and recall from the matrix diagonal and margins
+    tp = cm.diagonal().astype(np.float64)  # predicted label correctly
+    fp = cm.sum(axis=0) - tp  # predicted label but wrong
+    fn = cm.sum(axis=1) - tp  # was label but predicted something else
+    predicted = tp + fp
+    actual = tp + fn
+    precision_arr = np.divide(tp, predicted, out=np.zeros(n_labels), where=predicted > 0)
+    recall_arr = np.divide(tp, actual, out=np.zeros(n_labels), where=actual > 0)
+
+    precisions = {label: float(precision_arr[i]) for i, label in enumerate(labels)}
+    recalls = {label: float(recall_arr[i]) for i, label in enumerate(labels)}
 
     return EvaluationMetrics(
         accuracy=accuracy,
@@ -0,0 +1,89 @@
+"""Disk-backed cache of predictor outputs for pipeline stages that are pure functions of their inputs.
+
+dspy.LM's own request cache already avoids paying for a repeated request,
+but a hit there still renders the prompt, parses the reply through the
+adapter and waits on the LLM semaphore. This cache short-circuits the
+whole predictor call, so its key must cover everything that would change
+the request: LM, LM kwargs, adapter, predictor config and prompt state.
+"""
+
+import hashlib
+import json
+from typing import Optional
+
+import diskcache
+import dspy
+
+from src.context_.context import llm_cache_dir
+
+# diskcache is thread- and process-safe, so one cache is shared by all evaluator workers
+_cache = diskcache.Cache(llm_cache_dir)
+
+
+def _enabled() -> bool:
+    """Whether the configured LM allows caching; `dspy.LM(cache=False)` opts out here too."""
+    lm = dspy.settings.lm
+    return lm is None or getattr(lm, "cache", True)
+
+
+def _cache_key(predictor: dspy.Module, inputs: dict) -> str:
+    """Hash the configured LM and adapter, the predictor's prompt state and the call inputs.
+
+    The LM kwargs (temperature, max_tokens, ...), the adapter and each
+    predictor's own config (temperature, n, rollout_id passed to the
+    constructor) change the outputs, so they are part of the key. The
+    predictor state covers the
+    signature instructions and demos, so an optimizer that rewrites a prompt
+    never reads outputs cached for the old one.
+    """
+    lm = dspy.settings.lm
+    adapter = dspy.settings.adapter
+    payload = "|".join([
+        lm.model if lm is not None else "",
+        json.dumps(lm.kwargs if lm is not None else {}, sort_keys=True, default=str),
+        type(adapter).__name__ if adapter is not None else "",
+        json.dumps([p.config for p in predictor.predictors()], sort_keys=True, default=str),
+        json.dumps(predictor.dump_state(), sort_keys=True, default=str),
+        json.dumps(inputs, sort_keys=True, default=str),
+    ])
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def lookup(predictor: dspy.Module, inputs: dict) -> Optional[dspy.Prediction]:
+    """Return the cached prediction for these inputs, or None on a miss.
+
+    Hits are appended to the DSPy trace like a real call (bounded by
+    `max_trace_size`, as in dspy.Predict), so bootstrapping optimizers still
+    collect demos for the cached stage.
+    """
+    if not _enabled():
+        return None
+    outputs = _cache.get(_cache_key(predictor, inputs))
+    if outputs is None:
+        return None
+
+    prediction = dspy.Prediction(**outputs)
+    trace = dspy.settings.trace
+    max_trace_size = dspy.settings.max_trace_size
+    if trace is not None and max_trace_size > 0:
+        for p in predictor.predictors():
+            if len(trace) >= max_trace_size:
+                trace.pop(0)
+            trace.append((p, dict(inputs), prediction))
+    return prediction
+
+
+def store(predictor: dspy.Module, inputs: dict, prediction: dspy.Prediction) -> None:
+    """Cache a prediction's outputs for these inputs."""
+    if not _enabled():
+        return
+    _cache.set(_cache_key(predictor, inputs), prediction.toDict())
+
+
+def cached_call(predictor: dspy.Module, **inputs) -> dspy.Prediction:
+    """Call a predictor, serving repeated inputs from the disk cache."""
+    prediction = lookup(predictor, inputs)
+    if prediction is None:
+        prediction = predictor(**inputs)
+        store(predictor, inputs, prediction)
+    return prediction
@@ -1,17 +1,96 @@
 """Multi-hop QA pipeline using DSPy with Serper search and Firecrawl scraping."""
 
+import asyncio
+from typing import Callable, Optional, Union
+
 import dspy
+import orjson
 
+from src.context_.context import llm_concurrency
 from src.qaevolver.signatures.query_generation import (
     InitialQueryGeneration,
     FollowUpQueryGeneration,
+    BatchedInitialQueryGeneration,
 )
 from src.qaevolver.signatures.evidence_summarization import (
     EvidenceSummarization,
+    AnswerableEvidenceSummarization,
     CumulativeEvidenceSummarization,
 )
-from src.qaevolver.signatures.answer_generation import AnswerGeneration
-from src.qaevolver.modules.retriever import retrieve
+from src.qaevolver.signatures.answer_generation import AnswerGeneration, BatchedAnswerGeneration
+from src.qaevolver.signatures.fused import (
+    SummarizeAndAskFollowUp,
+    SummarizeCheckAndAskFollowUp,
+    SummarizeAndAnswer,
+)
+from src.qaevolver.modules import llm_cache
+from src.qaevolver.modules.llm_cache import cached_call
+from src.qaevolver.modules.retriever import RetrievalResult, aretrieve, retrieve
+from src.utils.general_utils import LoopSemaphore
+
+# Caps in-flight LLM calls across all concurrent aforward runs on an event loop
+LLM_SEM = LoopSemaphore(llm_concurrency)
+
+
+async def _acall(predictor: dspy.Module, cached: bool = False, **kwargs) -> dspy.Prediction:
+    """Call a predictor asynchronously under the shared LLM semaphore.
+
+    With `cached=True`, repeated inputs are served from the LLM disk cache.
+    """
+    if cached and (prediction := llm_cache.lookup(predictor, kwargs)) is not None:
+        return prediction
+    async with LLM_SEM:
+        prediction = await predictor.acall(**kwargs)
+    if cached:
+        llm_cache.store(predictor, kwargs, prediction)
+    return prediction
+
+
+def _scraped_content(retrieval: RetrievalResult) -> str:
+    """Return the retrieved page markdown, or a placeholder if nothing was retrieved."""
+    content = retrieval.scraped_page.markdown if retrieval.scraped_page else ""
+    return content or "No content retrieved."
+
+
+def _parse_json_list(text: str, expected_len: int) -> Optional[list[str]]:
+    """Parse a JSON list of strings from LLM output, or None if malformed or the wrong length."""
+    start, end = text.find("["), text.rfind("]")
+    if start == -1 or end < start:
+        return None
+    try:
+        items = orjson.loads(text[start:end + 1])
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(items, list) or len(items) != expected_len:
+        return None
+    return [str(item) for item in items]
+
+
+def _early_exit_hops(evidence_summary_1: str) -> dict[str, str]:
+    """Hop outputs for a question answerable from hop 1: hop 2 is skipped, step 7 uses hop 1 evidence."""
+    return {
+        "evidence_summary_1": evidence_summary_1,
+        "query_2": "",
+        "evidence_summary_2": evidence_summary_1,
+    }
+
+
+def _call_captured(capture: bool, fn: Callable, *args):
+    """Call `fn`, returning a raised exception instead of propagating it when `capture` is set."""
+    if not capture:
+        return fn(*args)
+    try:
+        return fn(*args)
+    except Exception as e:
+        return e
+
+
+def _to_prediction(result):
+    """Build a batched question's prediction from its (query_1, hops), passing exceptions through."""
+    if isinstance(result, BaseException):
+        return result
+    query_1, hops = result
+    return dspy.Prediction(query_1=query_1, **hops)
 
 
 class MultiHopQAPipeline(dspy.Module):
@@ -25,15 +104,54 @@ class MultiHopQAPipeline(dspy.Module):
         5. Retrieve (search + scrape) for hop 2
         6. Cumulatively summarize evidence from both hops
         7. Generate final answer from question + cumulative evidence
+
+    With `fuse_hops=True`, steps 3+4 and steps 6+7 each run as a single
+    LLM call, cutting LLM calls per question from 5 to 3.
+
+    With `early_exit=True`, the hop 1 summarizer also judges whether its
+    evidence already answers the question; if so, steps 4-6 are skipped and
+    the answer is generated from the hop 1 evidence.
+
+    `batch_forward` runs several questions at once. With `batch_steps=True`
+    it issues steps 1 and 7 as one LLM call for the whole batch, using
+    separate batched predictors that `forward` never calls (so a batched
+    run scores a different program than the one optimizers tune).
     """
 
-    def __init__(self):
+    def __init__(self, fuse_hops: bool = False, early_exit: bool = False, batch_steps: bool = False):
+        """Initialize the pipeline.
+
+        Args:
+            fuse_hops: Whether to fuse summarization with the follow-up query
+                (hop 1) and with answer generation (hop 2).
+            early_exit: Whether to skip hop 2 when the hop 1 evidence is
+                judged sufficient to answer the question.
+            batch_steps: Whether to add the batched initial-query and answer
+                predictors used by `batch_forward`.
+        """
         super().__init__()
+        self.fuse_hops = fuse_hops
+        self.early_exit = early_exit
+        self.batch_steps = batch_steps
         self.generate_initial_query = dspy.Predict(InitialQueryGeneration)
-        self.summarize_evidence_1 = dspy.ChainOfThought(EvidenceSummarization)
-        self.generate_followup_query = dspy.Predict(FollowUpQueryGeneration)
-        self.summarize_evidence_2 = dspy.ChainOfThought(CumulativeEvidenceSummarization)
-        self.generate_answer = dspy.ChainOfThought(AnswerGeneration)
+        if batch_steps:
+            self.generate_initial_queries = dspy.Predict(BatchedInitialQueryGeneration)
+        if fuse_hops:
+            self.summarize_and_ask_followup = dspy.ChainOfThought(
+                SummarizeCheckAndAskFollowUp if early_exit else SummarizeAndAskFollowUp
+            )
+            self.summarize_and_answer = dspy.ChainOfThought(SummarizeAndAnswer)
+        else:
+            self.summarize_evidence_1 = dspy.ChainOfThought(
+                AnswerableEvidenceSummarization if early_exit else EvidenceSummarization
+            )
+            self.generate_followup_query = dspy.Predict(FollowUpQueryGeneration)
+            self.summarize_evidence_2 = dspy.ChainOfThought(CumulativeEvidenceSummarization)
+        if not fuse_hops or early_exit:
+            # Fused hop 2 answers on its own, but early-exited questions still need step 7
+            self.generate_answer = dspy.Predict(AnswerGeneration)
+            if batch_steps:
+                self.generate_answers = dspy.Predict(BatchedAnswerGeneration)
 
     def forward(self, question: str) -> dspy.Prediction:
         """Execute the 2-hop retrieval pipeline.
@@ -45,55 +163,350 @@ class MultiHopQAPipeline(dspy.Module):
             dspy.Prediction with answer and intermediate artifacts.
         """
         # Step 1: Generate initial query
-        query_1_result = self.generate_initial_query(question=question)
-        query_1 = query_1_result.query
+        query_1 = cached_call(self.generate_initial_query, question=question).query
+
+        # Steps 2-6: Retrieve and summarize both hops
+        hops = self._run_hops(question, query_1)
+
+        # Step 7: Generate final answer (already produced by the fused hop 2)
+        if "answer" not in hops:
+            hops["answer"] = self.generate_answer(
+                question=question,
+                evidence_summary=hops["evidence_summary_2"],
+            ).answer
+
+        return dspy.Prediction(query_1=query_1, **hops)
+
+    async def aforward(self, question: str) -> dspy.Prediction:
+        """Async version of `forward`, awaiting LLM calls and retrieval.
+
+        Args:
+            question: The question to answer.
+
+        Returns:
+            dspy.Prediction with answer and intermediate artifacts.
+        """
+        # Step 1: Generate initial query
+        query_1 = (await _acall(self.generate_initial_query, cached=True, question=question)).query
+
+        # Steps 2-6: Retrieve and summarize both hops
+        hops = await self._arun_hops(question, query_1)
+
+        # Step 7: Generate final answer (already produced by the fused hop 2)
+        if "answer" not in hops:
+            hops["answer"] = (await _acall(
+                self.generate_answer,
+                question=question,
+                evidence_summary=hops["evidence_summary_2"],
+            )).answer
+
+        return dspy.Prediction(query_1=query_1, **hops)
 
+    def batch_forward(
+        self,
+        questions: list[str],
+        return_exceptions: bool = False,
+    ) -> list[Union[dspy.Prediction, Exception]]:
+        """Execute the pipeline for several questions, batching the stateless steps.
+
+        Initial query generation and final answer generation are each issued
+        as one LLM call for the whole batch; retrieval and summarization stay
+        per question. A batched step falls back to per-question calls if it
+        raises or its output cannot be parsed.
+
+        Args:
+            questions: The questions to answer.
+            return_exceptions: If True, a question that fails gets its exception
+                in place of a prediction instead of failing the whole batch.
+
+        Returns:
+            One dspy.Prediction (or exception) per question, in order.
+        """
+        # Step 1: Generate initial queries for the whole batch
+        queries_1 = self._batch_initial_queries(questions) or [None] * len(questions)
+
+        # Steps 2-6: Retrieve and summarize both hops per question
+        results = [
+            _call_captured(return_exceptions, self._question_hops, q, q1)
+            for q, q1 in zip(questions, queries_1)
+        ]
+
+        # Step 7: Generate final answers for the whole batch (skipping fused hop 2 answers)
+        pending = [
+            i for i, r in enumerate(results)
+            if not isinstance(r, Exception) and "answer" not in r[1]
+        ]
+        if pending:
+            answers = self._batch_answers(
+                [questions[i] for i in pending],
+                [results[i][1]["evidence_summary_2"] for i in pending],
+                return_exceptions=return_exceptions,
+            )
+            for i, answer in zip(pending, answers):
+                if isinstance(answer, Exception):
+                    results[i] = answer
+                else:
+                    results[i][1]["answer"] = answer
+
+        return [_to_prediction(r) for r in results]
+
+    async def abatch_forward(
+        self,
+        questions: list[str],
+        return_exceptions: bool = False,
+    ) -> list[Union[dspy.Prediction, Exception]]:
+        """Async version of `batch_forward`; the per-question hops run concurrently.
+
+        Args:
+            questions: The questions to answer.
+            return_exceptions: If True, a question that fails gets its exception
+                in place of a prediction instead of failing the whole batch.
+
+        Returns:
+            One dspy.Prediction (or exception) per question, in order.
+        """
+        # Step 1: Generate initial queries for the whole batch
+        queries_1 = await self._abatch_initial_queries(questions) or [None] * len(questions)
+
+        # Steps 2-6: Retrieve and summarize both hops per question
+        results = list(await asyncio.gather(
+            *(self._aquestion_hops(q, q1) for q, q1 in zip(questions, queries_1)),
+            return_exceptions=return_exceptions,
+        ))
+
+        # Step 7: Generate final answers for the whole batch (skipping fused hop 2 answers)
+        pending = [
+            i for i, r in enumerate(results)
+            if not isinstance(r, BaseException) and "answer" not in r[1]
+        ]
+        if pending:
+            answers = await self._abatch_answers(
+                [questions[i] for i in pending],
+                [results[i][1]["evidence_summary_2"] for i in pending],
+                return_exceptions=return_exceptions,
+            )
+            for i, answer in zip(pending, answers):
+                if isinstance(answer, BaseException):
+                    results[i] = answer
+                else:
+                    results[i][1]["answer"] = answer
+
+        return [_to_prediction(r) for r in results]
+
+    def _question_hops(self, question: str, query_1: Optional[str]) -> tuple[str, dict[str, str]]:
+        """Run steps 2-6 for one batched question, generating its own query if step 1 fell back."""
+        if query_1 is None:
+            query_1 = cached_call(self.generate_initial_query, question=question).query
+        return query_1, self._run_hops(question, query_1)
+
+    async def _aquestion_hops(self, question: str, query_1: Optional[str]) -> tuple[str, dict[str, str]]:
+        """Async version of `_question_hops`."""
+        if query_1 is None:
+            query_1 = (await _acall(self.generate_initial_query, cached=True, question=question)).query
+        return query_1, await self._arun_hops(question, query_1)
+
+    def _run_hops(self, question: str, query_1: str) -> dict[str, str]:
+        """Run steps 2-6 (and 7 when fused) for one question."""
         # Step 2: Retrieve for hop 1
-        retrieval_1 = retrieve(query_1)
-        scraped_content_1 = retrieval_1.scraped_page.markdown if retrieval_1.scraped_page else ""
-
-        if not scraped_content_1:
-            scraped_content_1 = "No content retrieved."
-
-        # Step 3: Summarize evidence from hop 1
-        evidence_1_result = self.summarize_evidence_1(
-            question=question,
-            scraped_content=scraped_content_1,
-        )
-        evidence_summary_1 = evidence_1_result.evidence_summary
-
-        # Step 4: Generate follow-up query
-        query_2_result = self.generate_followup_query(
-            question=question,
-            evidence_summary=evidence_summary_1,
-        )
-        query_2 = query_2_result.query
+        scraped_content_1 = _scraped_content(retrieve(query_1))
+
+        if self.fuse_hops:
+            # Steps 3-4: Summarize evidence from hop 1 and generate follow-up query
+            hop_1_result = cached_call(
+                self.summarize_and_ask_followup,
+                question=question,
+                scraped_content=scraped_content_1,
+            )
+        else:
+            # Step 3: Summarize evidence from hop 1
+            hop_1_result = cached_call(
+                self.summarize_evidence_1,
+                question=question,
+                scraped_content=scraped_content_1,
+            )
+        evidence_summary_1 = hop_1_result.evidence_summary
+
+        if self.early_exit and hop_1_result.answerable:
+            return _early_exit_hops(evidence_summary_1)
+
+        if self.fuse_hops:
+            query_2 = hop_1_result.followup_query
+        else:
+            # Step 4: Generate follow-up query
+            query_2 = self.generate_followup_query(
+                question=question,
+                evidence_summary=evidence_summary_1,
+            ).query
 
         # Step 5: Retrieve for hop 2
-        retrieval_2 = retrieve(query_2)
-        scraped_content_2 = retrieval_2.scraped_page.markdown if retrieval_2.scraped_page else ""
-
-        if not scraped_content_2:
-            scraped_content_2 = "No content retrieved."
-
-        # Step 6: Cumulative evidence summarization
-        evidence_2_result = self.summarize_evidence_2(
-            question=question,
-            prior_evidence_summary=evidence_summary_1,
-            scraped_content=scraped_content_2,
-        )
-        evidence_summary_2 = evidence_2_result.evidence_summary
-
-        # Step 7: Generate final answer
-        answer_result = self.generate_answer(
-            question=question,
-            evidence_summary=evidence_summary_2,
-        )
-
-        return dspy.Prediction(
-            answer=answer_result.answer,
-            query_1=query_1,
-            evidence_summary_1=evidence_summary_1,
-            query_2=query_2,
-            evidence_summary_2=evidence_summary_2,
-        )
+        scraped_content_2 = _scraped_content(retrieve(query_2))
+
+        hops = {
+            "evidence_summary_1": evidence_summary_1,
+            "query_2": query_2,
+        }
+        if self.fuse_hops:
+            # Steps 6-7: Cumulative evidence summarization and final answer
+            hop_2_result = cached_call(
+                self.summarize_and_answer,
+                question=question,
+                prior_evidence_summary=evidence_summary_1,
+                scraped_content=scraped_content_2,
+            )
+            hops["evidence_summary_2"] = hop_2_result.evidence_summary
+            hops["answer"] = hop_2_result.answer
+        else:
+            # Step 6: Cumulative evidence summarization
+            hops["evidence_summary_2"] = cached_call(
+                self.summarize_evidence_2,
+                question=question,
+                prior_evidence_summary=evidence_summary_1,
+                scraped_content=scraped_content_2,
+            ).evidence_summary
+        return hops
+
+    async def _arun_hops(self, question: str, query_1: str) -> dict[str, str]:
+        """Async version of `_run_hops`."""
+        # Step 2: Retrieve for hop 1
+        scraped_content_1 = _scraped_content(await aretrieve(query_1))
+
+        if self.fuse_hops:
+            # Steps 3-4: Summarize evidence from hop 1 and generate follow-up query
+            hop_1_result = await _acall(
+                self.summarize_and_ask_followup,
+                cached=True,
+                question=question,
+                scraped_content=scraped_content_1,
+            )
+        else:
+            # Step 3: Summarize evidence from hop 1
+            hop_1_result = await _acall(
+                self.summarize_evidence_1,
+                cached=True,
+                question=question,
+                scraped_content=scraped_content_1,
+            )
+        evidence_summary_1 = hop_1_result.evidence_summary
+
+        if self.early_exit and hop_1_result.answerable:
+            return _early_exit_hops(evidence_summary_1)
+
+        if self.fuse_hops:
+            query_2 = hop_1_result.followup_query
+        else:
+            # Step 4: Generate follow-up query
+            query_2 = (await _acall(
+                self.generate_followup_query,
+                question=question,
+                evidence_summary=evidence_summary_1,
+            )).query
+
+        # Step 5: Retrieve for hop 2
+        scraped_content_2 = _scraped_content(await aretrieve(query_2))
+
+        hops = {
+            "evidence_summary_1": evidence_summary_1,
+            "query_2": query_2,
+        }
+        if self.fuse_hops:
+            # Steps 6-7: Cumulative evidence summarization and final answer
+            hop_2_result = await _acall(
+                self.summarize_and_answer,
+                cached=True,
+                question=question,
+                prior_evidence_summary=evidence_summary_1,
+                scraped_content=scraped_content_2,
+            )
+            hops["evidence_summary_2"] = hop_2_result.evidence_summary
+            hops["answer"] = hop_2_result.answer
+        else:
+            # Step 6: Cumulative evidence summarization
+            hops["evidence_summary_2"] = (await _acall(
+                self.summarize_evidence_2,
+                cached=True,
+                question=question,
+                prior_evidence_summary=evidence_summary_1,
+                scraped_content=scraped_content_2,
+            )).evidence_summary
+        return hops
+
+    def _batch_initial_queries(self, questions: list[str]) -> Optional[list[str]]:
+        """Batched step 1, or None if the batched call raises or cannot be parsed."""
+        if not self.batch_steps:
+            return None
+        try:
+            result = self.generate_initial_queries(questions=orjson.dumps(questions).decode())
+        except Exception as e:
+            print(f"Batched initial query generation failed, falling back to per-question calls: {e}")
+            return None
+        return _parse_json_list(result.queries, len(questions))
+
+    async def _abatch_initial_queries(self, questions: list[str]) -> Optional[list[str]]:
+        """Async version of `_batch_initial_queries`."""
+        if not self.batch_steps:
+            return None
+        try:
+            result = await _acall(self.generate_initial_queries, questions=orjson.dumps(questions).decode())
+        except Exception as e:
+            print(f"Batched initial query generation failed, falling back to per-question calls: {e}")
+            return None
+        return _parse_json_list(result.queries, len(questions))
+
+    def _batch_answers(
+        self,
+        questions: list[str],
+        evidence_summaries: list[str],
+        return_exceptions: bool = False,
+    ) -> list[Union[str, Exception]]:
+        """Step 7 for several questions, batched if enabled; falls back to per-question calls."""
+        answers = None
+        if self.batch_steps:
+            payload = orjson.dumps([
+                {"question": q, "evidence_summary": e}
+                for q, e in zip(questions, evidence_summaries)
+            ]).decode()
+            try:
+                result = self.generate_answers(questions_and_evidence=payload)
+                answers = _parse_json_list(result.answers, len(questions))
+            except Exception as e:
+                print(f"Batched answer generation failed, falling back to per-question calls: {e}")
+                answers = None
+        if answers is None:
+            answers = [
+                _call_captured(return_exceptions, self._answer, q, e)
+                for q, e in zip(questions, evidence_summaries)
+            ]
+        return answers
+
+    async def _abatch_answers(
+        self,
+        questions: list[str],
+        evidence_summaries: list[str],
+        return_exceptions: bool = False,
+    ) -> list[Union[str, BaseException]]:
+        """Async version of `_batch_answers`."""
+        answers = None
+        if self.batch_steps:
+            payload = orjson.dumps([
+                {"question": q, "evidence_summary": e}
+                for q, e in zip(questions, evidence_summaries)
+            ]).decode()
+            try:
+                result = await _acall(self.generate_answers, questions_and_evidence=payload)
+                answers = _parse_json_list(result.answers, len(questions))
+            except Exception as e:
+                print(f"Batched answer generation failed, falling back to per-question calls: {e}")
+                answers = None
+        if answers is None:
+            results = await asyncio.gather(
+                *(
+                    _acall(self.generate_answer, question=q, evidence_summary=e)
+                    for q, e in zip(questions, evidence_summaries)
+                ),
+                return_exceptions=return_exceptions,
+            )
+            answers = [r if isinstance(r, BaseException) else r.answer for r in results]
+        return answers
+
+    def _answer(self, question: str, evidence_summary: str) -> str:
+        return self.generate_answer(question=question, evidence_summary=evidence_summary).answer
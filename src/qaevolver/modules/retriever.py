@@ -1,16 +1,27 @@
 """Retrieval module combining Serper search and Firecrawl scraping."""
 
-from dataclasses import dataclass, field
+import asyncio
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from typing import Optional
 
+import diskcache
+
+from src.context_.context import firecrawl_concurrency, scrape_cache_dir, serper_concurrency
 from src.services import SerperService, SearchResult, FirecrawlService, ScrapedPage
+from src.utils.general_utils import LoopSemaphore, clean_llm_outputted_url
 
 
-@dataclass
+@dataclass(frozen=True)
 class RetrievalResult:
-    """Result from a search + scrape retrieval step."""
+    """Result from a search + scrape retrieval step.
+
+    Immutable, since results are shared between callers through the
+    query-level retrieval cache.
+    """
     query: str
-    search_results: list[SearchResult] = field(default_factory=list)
+    search_results: tuple[SearchResult, ...] = ()
     scraped_page: Optional[ScrapedPage] = None
     success: bool = False
     error: Optional[str] = None
@@ -19,12 +30,73 @@ class RetrievalResult:
 _serper = SerperService()
 _firecrawl = FirecrawlService()
 
+# Admission control for the async path; each service has its own quota (per event loop)
+SERPER_SEM = LoopSemaphore(serper_concurrency)
+FIRECRAWL_SEM = LoopSemaphore(firecrawl_concurrency)
+
+# Successful scrapes keyed by URL, so a page hit by both hops or by several
+# questions is only scraped once; shared across processes and restarts
+_scrape_cache = diskcache.Cache(scrape_cache_dir, size_limit=5 << 30)
+
+
+def _cached_scrape(url: str) -> Optional[ScrapedPage]:
+    return _scrape_cache.get(clean_llm_outputted_url(url))
+
+
+def _cache_scrape(scraped: ScrapedPage) -> None:
+    if scraped.success and scraped.markdown:
+        _scrape_cache.set(clean_llm_outputted_url(scraped.url), scraped)
+
+
+# Retrievals with a successfully scraped page, keyed by normalized query, so
+# repeated queries within a run skip both billed API calls. A small LRU shared
+# by the sync and async paths (functools.lru_cache cannot memoize coroutines,
+# and would also cache failures).
+_RETRIEVAL_CACHE_SIZE = 4096
+_retrieval_cache: "OrderedDict[tuple[str, int], RetrievalResult]" = OrderedDict()
+_retrieval_cache_lock = threading.Lock()
+
+
+def _query_key(query: str, num_search_results: int) -> tuple[str, int]:
+    return " ".join(query.lower().split()), num_search_results
+
+
+def _lookup_retrieval(query: str, num_search_results: int) -> Optional[RetrievalResult]:
+    key = _query_key(query, num_search_results)
+    with _retrieval_cache_lock:
+        result = _retrieval_cache.get(key)
+        if result is None:
+            return None
+        _retrieval_cache.move_to_end(key)
+    return replace(result, query=query)
+
+
+def _store_retrieval(result: RetrievalResult, num_search_results: int) -> None:
+    # Snippet fallbacks (scrape errors, timeouts) are not cached, so the next
+    # occurrence of the query retries the scrape
+    if not (result.scraped_page and result.scraped_page.success):
+        return
+    key = _query_key(result.query, num_search_results)
+    with _retrieval_cache_lock:
+        _retrieval_cache[key] = result
+        _retrieval_cache.move_to_end(key)
+        if len(_retrieval_cache) > _RETRIEVAL_CACHE_SIZE:
+            _retrieval_cache.popitem(last=False)
+
+
+async def aclose() -> None:
+    """Close the pooled async HTTP clients used by `aretrieve`."""
+    await _serper.aclose()
+    await _firecrawl.aclose()
+
 
 def retrieve(query: str, num_search_results: int = 10) -> RetrievalResult:
     """Execute a search query and scrape the top result.
 
     Uses Serper for web search, then Firecrawl to scrape the top-1 result.
-    Falls back to search snippets if scraping fails.
+    Repeated queries (compared case- and whitespace-insensitively) and
+    pages already scraped are served from cache. Falls back to search
+    snippets if scraping fails.
 
     Args:
         query: The search query to execute.
@@ -33,37 +105,122 @@ def retrieve(query: str, num_search_results: int = 10) -> RetrievalResult:
     Returns:
         RetrievalResult with search results and scraped content.
     """
-    result = RetrievalResult(query=query)
+    cached = _lookup_retrieval(query, num_search_results)
+    if cached is not None:
+        return cached
 
     try:
         search_results = _serper.search(query, num_results=num_search_results)
-        result.search_results = search_results
     except Exception as e:
-        result.error = f"Search failed: {e}"
-        return result
+        return RetrievalResult(query=query, error=f"Search failed: {e}")
 
     if not search_results:
-        result.error = "No search results returned"
-        return result
+        return RetrievalResult(query=query, error="No search results returned")
 
-    top_result = search_results[0]
-    scraped = _firecrawl.scrape(top_result.link)
-    result.scraped_page = scraped
+    top_link = search_results[0].link
+    scraped = _cached_scrape(top_link)
+    if scraped is None:
+        scraped = _firecrawl.scrape(top_link)
+        _cache_scrape(scraped)
 
-    if scraped.success and scraped.markdown:
-        result.success = True
-    else:
-        result.success = True
-        snippets = "\n\n".join(
-            f"**{sr.title}**\n{sr.snippet}"
-            for sr in search_results[:5]
-        )
-        result.scraped_page = ScrapedPage(
-            url=top_result.link,
-            markdown=snippets,
-            title="Search snippets (scrape fallback)",
-            success=False,
-            error=scraped.error or "Scrape returned empty content"
-        )
+    result = _finalize(query, search_results, scraped, _snippet_fallback(search_results))
+    _store_retrieval(result, num_search_results)
+    return result
+
+
+async def aretrieve(
+    query: str,
+    num_search_results: int = 10,
+    scrape_timeout: float = 30.0,
+) -> RetrievalResult:
+    """Async version of `retrieve`.
+
+    The scrape of the top result is started as soon as the search returns,
+    and the snippet fallback is built once the scrape request has been
+    issued, while it is in flight. If the scrape
+    does not finish within `scrape_timeout`, the fallback is returned
+    immediately.
+
+    Args:
+        query: The search query to execute.
+        num_search_results: Number of search results to request from Serper.
+        scrape_timeout: Seconds to wait for the scrape before falling back.
 
+    Returns:
+        RetrievalResult with search results and scraped content.
+    """
+    cached = _lookup_retrieval(query, num_search_results)
+    if cached is not None:
+        return cached
+
+    try:
+        async with SERPER_SEM:
+            search_results = await _serper.asearch(query, num_results=num_search_results)
+    except Exception as e:
+        return RetrievalResult(query=query, error=f"Search failed: {e}")
+
+    if not search_results:
+        return RetrievalResult(query=query, error="No search results returned")
+
+    top_link = search_results[0].link
+    scraped = _cached_scrape(top_link)
+    if scraped is not None:
+        result = _finalize(query, search_results, scraped, _snippet_fallback(search_results))
+        _store_retrieval(result, num_search_results)
+        return result
+
+    async with FIRECRAWL_SEM:
+        scrape_task = asyncio.create_task(_firecrawl.ascrape(top_link))
+        # Yield once so the task actually sends its request before the fallback is built
+        await asyncio.sleep(0)
+        fallback = _snippet_fallback(search_results)
+
+        try:
+            scraped = await asyncio.wait_for(scrape_task, timeout=scrape_timeout)
+        except asyncio.TimeoutError:
+            scraped = ScrapedPage(
+                url=top_link,
+                markdown="",
+                title=None,
+                success=False,
+                error=f"Scrape timed out after {scrape_timeout:.0f} seconds"
+            )
+
+    _cache_scrape(scraped)
+    result = _finalize(query, search_results, scraped, fallback)
+    _store_retrieval(result, num_search_results)
     return result
+
+
+def _finalize(
+    query: str,
+    search_results: list[SearchResult],
+    scraped: ScrapedPage,
+    fallback: ScrapedPage,
+) -> RetrievalResult:
+    """Build the result with the scraped page, or the snippet fallback if scraping failed."""
+    if not (scraped.success and scraped.markdown):
+        scraped = replace(
+            fallback,
+            error=scraped.error or "Scrape returned empty content",
+        )
+    return RetrievalResult(
+        query=query,
+        search_results=tuple(search_results),
+        scraped_page=scraped,
+        success=True,
+    )
+
+
+def _snippet_fallback(search_results: list[SearchResult]) -> ScrapedPage:
+    """Build a pseudo-page from the top search snippets."""
+    snippets = "\n\n".join(
+        f"**{sr.title}**\n{sr.snippet}"
+        for sr in search_results[:5]
+    )
+    return ScrapedPage(
+        url=search_results[0].link,
+        markdown=snippets,
+        title="Search snippets (scrape fallback)",
+        success=False,
+    )
@@ -9,3 +9,10 @@ class AnswerGeneration(dspy.Signature):
     question: str = dspy.InputField(desc="The question to answer")
     evidence_summary: str = dspy.InputField(desc="Summary of all gathered evidence relevant to the question")
     answer: str = dspy.OutputField(desc="A concise answer to the question based on the evidence")
+
+
+class BatchedAnswerGeneration(dspy.Signature):
+    """Given a JSON list of questions, each with its gathered evidence, generate a concise answer to each question. Return the answers as a JSON list in the same order as the questions."""
+
+    questions_and_evidence: str = dspy.InputField(desc="JSON list of objects with 'question' and 'evidence_summary' keys")
+    answers: str = dspy.OutputField(desc="JSON list of concise answers, exactly one per question, in the same order")
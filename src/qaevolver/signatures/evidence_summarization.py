@@ -18,3 +18,12 @@ class CumulativeEvidenceSummarization(dspy.Signature):
     prior_evidence_summary: str = dspy.InputField(desc="Summary of evidence gathered from previous retrieval steps")
     scraped_content: str = dspy.InputField(desc="Newly scraped web page content")
     evidence_summary: str = dspy.OutputField(desc="A cumulative summary of all evidence relevant to answering the question")
+
+
+class AnswerableEvidenceSummarization(dspy.Signature):
+    """Given a question and scraped web content, summarize the key evidence relevant to answering the question, and judge whether that evidence alone is enough to fully answer the question."""
+
+    question: str = dspy.InputField(desc="The question to answer")
+    scraped_content: str = dspy.InputField(desc="Scraped web page content")
+    evidence_summary: str = dspy.OutputField(desc="A summary of the key evidence relevant to answering the question")
+    answerable: bool = dspy.OutputField(desc="True if the question can be fully answered from scraped_content alone")
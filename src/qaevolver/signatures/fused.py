@@ -0,0 +1,32 @@
+"""Fused DSPy signatures combining adjacent steps of the multi-hop QA pipeline into one call."""
+
+import dspy
+
+
+class SummarizeAndAskFollowUp(dspy.Signature):
+    """Given a question and scraped web content, summarize the key evidence relevant to answering the question, then generate a follow-up search query to find additional information needed to answer the question."""
+
+    question: str = dspy.InputField(desc="The question to answer")
+    scraped_content: str = dspy.InputField(desc="Scraped web page content")
+    evidence_summary: str = dspy.OutputField(desc="A summary of the key evidence relevant to answering the question")
+    followup_query: str = dspy.OutputField(desc="A follow-up search query to find additional information needed to answer the question")
+
+
+class SummarizeAndAnswer(dspy.Signature):
+    """Given a question, previously gathered evidence, and new scraped web content, produce a cumulative summary of all evidence relevant to answering the question, then generate a concise answer to the question."""
+
+    question: str = dspy.InputField(desc="The question to answer")
+    prior_evidence_summary: str = dspy.InputField(desc="Summary of evidence gathered from previous retrieval steps")
+    scraped_content: str = dspy.InputField(desc="Newly scraped web page content")
+    evidence_summary: str = dspy.OutputField(desc="A cumulative summary of all evidence relevant to answering the question")
+    answer: str = dspy.OutputField(desc="A concise answer to the question based on the evidence")
+
+
+class SummarizeCheckAndAskFollowUp(dspy.Signature):
+    """Given a question and scraped web content, summarize the key evidence relevant to answering the question, judge whether that evidence alone is enough to fully answer the question, then generate a follow-up search query to find additional information needed to answer the question."""
+
+    question: str = dspy.InputField(desc="The question to answer")
+    scraped_content: str = dspy.InputField(desc="Scraped web page content")
+    evidence_summary: str = dspy.OutputField(desc="A summary of the key evidence relevant to answering the question")
+    answerable: bool = dspy.OutputField(desc="True if the question can be fully answered from scraped_content alone")
+    followup_query: str = dspy.OutputField(desc="A follow-up search query to find additional information needed to answer the question")
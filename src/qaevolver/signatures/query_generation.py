@@ -16,3 +16,10 @@ class FollowUpQueryGeneration(dspy.Signature):
     question: str = dspy.InputField(desc="The question to answer")
     evidence_summary: str = dspy.InputField(desc="Summary of evidence gathered so far")
     query: str = dspy.OutputField(desc="A follow-up search query to find additional information needed to answer the question")
+
+
+class BatchedInitialQueryGeneration(dspy.Signature):
+    """Given a JSON list of questions, generate one search query per question to find relevant information. Return the queries as a JSON list in the same order as the questions."""
+
+    questions: str = dspy.InputField(desc="JSON list of questions to answer")
+    queries: str = dspy.OutputField(desc="JSON list of search queries, exactly one per question, in the same order")
@@ -1,13 +1,44 @@
 """Firecrawl API service for web page scraping."""
+import asyncio
+import functools
+import re
 import time
+import weakref
 from dataclasses import dataclass
 from typing import Optional
-from firecrawl import Firecrawl
+import tiktoken
+from firecrawl import AsyncFirecrawl, Firecrawl
 from firecrawl.v2.types import PDFParser
 from src.context_.context import firecrawl_key
 from src.utils.general_utils import clean_llm_outputted_url
 
-@dataclass
+# Runs of 3+ consecutive markdown links (nav bars, footers, link lists)
+_LINK_RUNS = re.compile(r"(\[[^\]]*\]\([^)]*\)\s*){3,}")
+_EXTRA_NEWLINES = re.compile(r"\n{3,}")
+
+
+@functools.cache
+def _encoding() -> tiktoken.Encoding:
+    """Tokenizer used by GPT-4.1, so the truncation budget matches real prompt tokens.
+
+    Loaded on first use rather than at import, since tiktoken downloads the
+    BPE file the first time and importing the services should not need network.
+    """
+    return tiktoken.get_encoding("o200k_base")
+
+
+def _clean_markdown(markdown: str, max_tokens: int) -> str:
+    """Drop link-list boilerplate, collapse blank lines and truncate to `max_tokens` tokens."""
+    markdown = _LINK_RUNS.sub("", markdown)
+    markdown = _EXTRA_NEWLINES.sub("\n\n", markdown)
+    encoding = _encoding()
+    tokens = encoding.encode(markdown, disallowed_special=())
+    if len(tokens) > max_tokens:
+        markdown = encoding.decode(tokens[:max_tokens]) + "\n\n[Content truncated...]"
+    return markdown
+
+
+@dataclass(frozen=True)
 class ScrapedPage:
     """Result from scraping a web page."""
     url: str
@@ -31,11 +62,37 @@ class FirecrawlService:
             api_key: Firecrawl API key.
         """
         self.client = Firecrawl(api_key=firecrawl_key)
+        # One async client per event loop: its httpx pool is bound to the loop that created it
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncFirecrawl]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def async_client(self) -> AsyncFirecrawl:
+        """Async Firecrawl client for the running event loop, created on first use."""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = AsyncFirecrawl(api_key=firecrawl_key)
+        return client
+
+    async def aclose(self) -> None:
+        """Close the running event loop's async client, if one was created.
+
+        AsyncFirecrawl has no close method of its own, so this closes the
+        httpx client of its v2 HTTP layer.
+        """
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is None:
+            return
+        http_client = getattr(getattr(client, "_v2_client", None), "async_http_client", None)
+        if http_client is not None:
+            await http_client.close()
 
     def scrape(
         self,
         url: str,
-        max_length: int = 10000,
+        max_tokens: int = 3000,
         max_pdf_pages: int = 30,
         skip_pdfs: bool = True
     ) -> ScrapedPage:
@@ -43,7 +100,7 @@ class FirecrawlService:
 
         Args:
             url: URL to scrape.
-            max_length: Maximum characters to return (truncate if longer).
+            max_tokens: Maximum tokens of cleaned markdown to return (truncate if longer).
 
         Returns:
             ScrapedPage with markdown content or error information.
@@ -53,25 +110,42 @@ class FirecrawlService:
             url = clean_llm_outputted_url(url)
             if url.lower().endswith(".pdf") and skip_pdfs:
                 #result = client.scrape(url, formats=["markdown"], parsers = [PDFParser(type= "pdf", max_pages = 1)])
-                return ScrapedPage(
-                    url=url,
-                    markdown="PDF scraping is temporarily unavailable.",
-                    title=None,
-                    success=False
-                )
+                return self._pdf_unavailable(url)
             result = self.client.scrape(url, formats=["markdown"])
             #result = client.scrape(url, formats=["markdown"])
-            markdown = result.markdown
-            # Truncate if needed to manage token costs
-            if len(markdown) > max_length:
-                markdown = markdown[:max_length] + "\n\n[Content truncated...]"
-            print(f"URL scrape time. Url: {url}. \nTime: {time.time() - start_time:.2f} seconds")
+            return self._to_scraped_page(url, result, max_tokens, start_time)
+        except Exception as e:
             return ScrapedPage(
                 url=url,
-                markdown=markdown,
-                title=result.metadata.title,
-                success=True
+                markdown="",
+                title=None,
+                success=False,
+                error=str(e)
             )
+
+    async def ascrape(
+        self,
+        url: str,
+        max_tokens: int = 3000,
+        max_pdf_pages: int = 30,
+        skip_pdfs: bool = True
+    ) -> ScrapedPage:
+        """Async version of `scrape` using the AsyncFirecrawl client.
+
+        Args:
+            url: URL to scrape.
+            max_tokens: Maximum tokens of cleaned markdown to return (truncate if longer).
+
+        Returns:
+            ScrapedPage with markdown content or error information.
+        """
+        start_time = time.time()
+        try:
+            url = clean_llm_outputted_url(url)
+            if url.lower().endswith(".pdf") and skip_pdfs:
+                return self._pdf_unavailable(url)
+            result = await self.async_client.scrape(url, formats=["markdown"])
+            return self._to_scraped_page(url, result, max_tokens, start_time)
         except Exception as e:
             return ScrapedPage(
                 url=url,
@@ -80,3 +154,25 @@ class FirecrawlService:
                 success=False,
                 error=str(e)
             )
+
+    @staticmethod
+    def _pdf_unavailable(url: str) -> ScrapedPage:
+        return ScrapedPage(
+            url=url,
+            markdown="PDF scraping is temporarily unavailable.",
+            title=None,
+            success=False
+        )
+
+    @staticmethod
+    def _to_scraped_page(url: str, result, max_tokens: int, start_time: float) -> ScrapedPage:
+        """Build a ScrapedPage from a Firecrawl document, cleaning and truncating the markdown."""
+        # Strip boilerplate and truncate to manage token costs
+        markdown = _clean_markdown(result.markdown, max_tokens)
+        print(f"URL scrape time. Url: {url}. \nTime: {time.time() - start_time:.2f} seconds")
+        return ScrapedPage(
+            url=url,
+            markdown=markdown,
+            title=result.metadata.title,
+            success=True
+        )
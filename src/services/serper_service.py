@@ -1,14 +1,25 @@
 """Serper API service for Google Search."""
 
+import asyncio
+import importlib.util
+import weakref
+
+import httpx
+import orjson
 import requests
 from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional
 from src.context_.context import serper_key
 import time
 from typing import Literal
 
+# httpx only speaks HTTP/2 with the optional h2 package; fall back to HTTP/1.1 without it
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
 
-@dataclass
+@dataclass(frozen=True)
 class SearchResult:
     """A single search result from Serper."""
     title: str
@@ -34,6 +45,70 @@ class SerperService:
             api_key: Serper API key.
         """
         self.api_key = serper_key
+        # Pooled keep-alive session so repeated searches reuse TCP/TLS connections
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504],
+                # Serper searches are idempotent, so POSTs are safe to retry
+                allowed_methods=None,
+                # Hand the final response to raise_for_status instead of raising RetryError
+                raise_on_status=False,
+            ),
+        ))
+        # One async client per event loop: its pool is bound to the loop that created it
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Shared HTTP/2 client for async searches on the running event loop, created on first use.
+
+        Concurrent searches are multiplexed over pooled connections instead
+        of opening one TLS connection per request (pooled HTTP/1.1 if h2 is
+        not installed). Each event loop gets its own client, so repeated
+        asyncio.run calls never reuse a pool bound to a closed loop.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = httpx.AsyncClient(
+                http2=_HTTP2,
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            )
+        return client
+
+    async def aclose(self) -> None:
+        """Close the running event loop's async client, if one was created."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def _headers(self) -> dict[str, str]:
+        """Build request headers for the Serper API."""
+        return {
+            "X-API-KEY": self.api_key,
+            "Content-Type": "application/json"
+        }
+
+    @staticmethod
+    def _parse_organic(data: dict) -> list[SearchResult]:
+        """Convert the organic results of a Serper response into SearchResults."""
+        results = []
+        for i, item in enumerate(data.get("organic", [])):
+            results.append(SearchResult(
+                title=item.get("title", ""),
+                link=item.get("link", ""),
+                snippet=item.get("snippet", ""),
+                position=i + 1
+            ))
+        return results
 
     def search(
         self,
@@ -54,10 +129,6 @@ class SerperService:
         Raises:
             requests.HTTPError: If the API request fails.
         """
-        headers = {
-            "X-API-KEY": self.api_key,
-            "Content-Type": "application/json"
-        }
         payload = {
             "q": query,
             "num": num_results,
@@ -65,18 +136,42 @@ class SerperService:
         }
 
         start_time = time.time()
-        response = requests.post(self.BASE_URL, json=payload, headers=headers)
+        response = self._session.post(self.BASE_URL, json=payload, headers=self._headers(), timeout=(3, 15))
         response.raise_for_status()
-        data = response.json()
-        results = []
+        results = self._parse_organic(orjson.loads(response.content))
 
-        for i, item in enumerate(data.get("organic", [])):
-            results.append(SearchResult(
-                title=item.get("title", ""),
-                link=item.get("link", ""),
-                snippet=item.get("snippet", ""),
-                position=i + 1
-            ))
+        print(f"Serper search time. Query: {query}. \nTime: {time.time() - start_time:.2f} seconds")
+        return results
+
+    async def asearch(
+        self,
+        query: str,
+        num_results: int = 10,
+        country: str = "us"
+    ) -> list[SearchResult]:
+        """Async version of `search` using the shared HTTP/2 httpx client.
+
+        Args:
+            query: Search query string.
+            num_results: Number of results to return (max 100).
+            country: Country code for localized results.
+
+        Returns:
+            List of SearchResult objects.
+
+        Raises:
+            httpx.HTTPStatusError: If the API request fails.
+        """
+        payload = {
+            "q": query,
+            "num": num_results,
+            "gl": country
+        }
+
+        start_time = time.time()
+        response = await self.async_client.post(self.BASE_URL, json=payload, headers=self._headers())
+        response.raise_for_status()
+        results = self._parse_organic(orjson.loads(response.content))
 
         print(f"Serper search time. Query: {query}. \nTime: {time.time() - start_time:.2f} seconds")
         return results
@@ -98,10 +193,6 @@ class SerperService:
         Raises:
             requests.HTTPError: If the API request fails.
         """
-        headers = {
-            "X-API-KEY": self.api_key,
-            "Content-Type": "application/json"
-        }
         if recency:
             payload = {
                 "q": query,
@@ -113,9 +204,9 @@ class SerperService:
             }
 
         start_time = time.time()
-        response = requests.post(self.NEWS_URL, json=payload, headers=headers)
+        response = self._session.post(self.NEWS_URL, json=payload, headers=self._headers(), timeout=(3, 15))
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         # Extract news articles from response
         articles = data.get("news", [])
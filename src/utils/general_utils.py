@@ -1,4 +1,6 @@
+import asyncio
 import json
+import weakref
 
 def clean_llm_outputted_url(url: str) -> str:
     """Clean a URL for LLM use."""
@@ -16,4 +18,33 @@ def clean_llm_outputted_url(url: str) -> str:
                         break
         except json.JSONDecodeError:
             pass
-    return clean_url
\ No newline at end of file
+    return clean_url
+
+
+class LoopSemaphore:
+    """An asyncio.Semaphore per running event loop, for module-level admission control.
+
+    A plain asyncio.Semaphore binds to the first loop that waits on it, so a
+    second asyncio.run (e.g. the next optimizer evaluation) would fail with
+    "bound to a different event loop". Each loop gets its own semaphore with
+    the same limit, created on first use and dropped with the loop.
+    """
+
+    def __init__(self, value: int):
+        self._value = value
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self._value)
+        return semaphore
+
+    async def __aenter__(self) -> None:
+        await self._semaphore().acquire()
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._semaphore().release()